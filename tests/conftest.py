@@ -1,13 +1,13 @@
 # tests/conftest.py
 
 # Standard library imports
+from copy import copy
+from types import SimpleNamespace
 from unittest.mock import Mock
-from unittest.mock import patch
 
 # Third party imports
 from pytest import fixture
 from requests import Response
-from requests_oauthlib import OAuth2Session
 
 # fmt: off
 # isort: off
@@ -37,12 +37,23 @@ from fitbit_client.resources.user import UserResource
 # fmt: on
 
 
+class StubOAuth:
+    """Lightweight stand-in for OAuth2Session
+
+    Resources only touch `request` (and `token` when building debug curl
+    commands), so a slotted object avoids the cost of a spec'd Mock.
+    """
+
+    __slots__ = ("request", "token")
+
+    def __init__(self):
+        self.request = Mock()
+
+
 @fixture
 def mock_oauth_session():
-    """Fixture to provide a mocked OAuth2Session with standard configuration"""
-    session = Mock(spec=OAuth2Session)
-    session.request = Mock()
-    return session
+    """Fixture to provide a stubbed OAuth2Session with a mocked request method"""
+    return StubOAuth()
 
 
 @fixture
@@ -71,7 +82,7 @@ def mock_logger():
     return Mock()
 
 
-@fixture
+@fixture(scope="session")
 def mock_response_factory():
     """Factory fixture for creating mock responses with specific attributes"""
 
@@ -96,148 +107,240 @@ def mock_response_factory():
     return _create_mock_response
 
 
+@fixture(scope="session")
+def fake_response_factory():
+    """Factory fixture for lightweight responses when a spec'd Mock is not needed
+
+    BaseResource only reads status_code, headers, text, and json(), so a
+    SimpleNamespace is enough. json stays a Mock so tests can set side_effect.
+    """
+
+    def _create_fake_response(
+        status_code=200, headers=None, text="", json_data=None, json_error=None
+    ):
+        json = Mock(side_effect=json_error) if json_error else Mock(return_value=json_data)
+        return SimpleNamespace(status_code=status_code, headers=headers or {}, text=text, json=json)
+
+    return _create_fake_response
+
+
 @fixture
-def base_resource(mock_oauth_session, mock_logger):
-    """Fixture to provide a BaseResource instance with standard locale settings"""
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        resource = BaseResource(
-            oauth_session=mock_oauth_session,
-            locale="en_US",
-            language="en_US",
-            max_retries=3,
-            retry_after_seconds=60,
-            retry_backoff_factor=1.5,
+def error_response(request, mock_response_factory):
+    """Build a mock response from an indirect (status_code, json_data) parameter"""
+    return mock_response_factory(*request.param)
+
+
+@fixture
+def respond_with(mock_oauth_session, mock_response_factory):
+    """Factory fixture that makes the OAuth session return a response with the given payload"""
+
+    def _respond_with(json_data, status_code=200):
+        response = mock_response_factory(status_code, json_data)
+        mock_oauth_session.request.return_value = response
+        return response
+
+    return _respond_with
+
+
+@fixture(scope="session")
+def azm_url():
+    """Factory fixture for building expected Active Zone Minutes time series URLs"""
+
+    def _azm_url(user_id, segment):
+        return (
+            f"https://api.fitbit.com/1/user/{user_id}/activities/active-zone-minutes/date/"
+            f"{segment}.json"
         )
-        return resource
+
+    return _azm_url
+
+
+def _with_mock_loggers(resource, logger):
+    """Point a resource's application and data loggers at the given mock"""
+    resource.logger = logger
+    resource.data_logger = logger
+    return resource
+
+
+@fixture(scope="session")
+def _base_resource_template():
+    """Build one BaseResource that base_resource copies for each test
+
+    Retries are off by default; retry tests set max_retries themselves.
+    """
+    return BaseResource(
+        oauth_session=StubOAuth(),
+        locale="en_US",
+        language="en_US",
+        max_retries=0,
+        retry_after_seconds=60,
+        retry_backoff_factor=1.5,
+    )
+
+
+@fixture
+def base_resource(_base_resource_template, mock_oauth_session, mock_logger):
+    """Fixture to provide a BaseResource instance with standard locale settings"""
+    resource = copy(_base_resource_template)
+    resource.headers = dict(_base_resource_template.headers)
+    resource.oauth = mock_oauth_session
+    return _with_mock_loggers(resource, mock_logger)
 
 
 @fixture
 def activity_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return ActivityResource(oauth_session=mock_oauth_session, locale="en_US", language="en_US")
+    """Fixture to provide an ActivityResource whose _make_request is a mock"""
+    resource = _with_mock_loggers(
+        ActivityResource(oauth_session=mock_oauth_session, locale="en_US", language="en_US"),
+        mock_logger,
+    )
+    # Most activity tests only assert on the arguments passed to _make_request
+    resource._make_request = Mock(spec=resource._make_request)
+    return resource
+
+
+@fixture(scope="module")
+def _activity_timeseries_resource_module():
+    """Build one ActivityTimeSeriesResource per test module"""
+    return ActivityTimeSeriesResource(oauth_session=StubOAuth(), locale="en_US", language="en_US")
 
 
 @fixture
-def activity_timeseries_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return ActivityTimeSeriesResource(
-            oauth_session=mock_oauth_session, locale="en_US", language="en_US"
-        )
+def activity_timeseries_resource(
+    _activity_timeseries_resource_module, mock_oauth_session, mock_logger
+):
+    resource = _with_mock_loggers(_activity_timeseries_resource_module, mock_logger)
+    resource.oauth = mock_oauth_session
+    return resource
 
 
 @fixture
 def azm_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return ActiveZoneMinutesResource(
+    return _with_mock_loggers(
+        ActiveZoneMinutesResource(
             oauth_session=mock_oauth_session, locale="en_US", language="en_US"
-        )
+        ),
+        mock_logger,
+    )
 
 
 @fixture
 def body_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return BodyResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(BodyResource(mock_oauth_session, "en_US", "en_US"), mock_logger)
 
 
 @fixture
 def body_timeseries(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return BodyTimeSeriesResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(
+        BodyTimeSeriesResource(mock_oauth_session, "en_US", "en_US"), mock_logger
+    )
 
 
 @fixture
 def breathing_rate_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return BreathingRateResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(
+        BreathingRateResource(mock_oauth_session, "en_US", "en_US"), mock_logger
+    )
 
 
 @fixture
 def cardio_fitness_score_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return CardioFitnessScoreResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(
+        CardioFitnessScoreResource(mock_oauth_session, "en_US", "en_US"), mock_logger
+    )
 
 
 @fixture
 def device_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return DeviceResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(DeviceResource(mock_oauth_session, "en_US", "en_US"), mock_logger)
 
 
 @fixture
 def ecg_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return ElectrocardiogramResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(
+        ElectrocardiogramResource(mock_oauth_session, "en_US", "en_US"), mock_logger
+    )
 
 
 @fixture
 def friends_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return FriendsResource(oauth_session=mock_oauth_session, locale="en_US", language="en_US")
+    return _with_mock_loggers(
+        FriendsResource(oauth_session=mock_oauth_session, locale="en_US", language="en_US"),
+        mock_logger,
+    )
 
 
 @fixture
 def heartrate_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return HeartrateTimeSeriesResource(
+    return _with_mock_loggers(
+        HeartrateTimeSeriesResource(
             oauth_session=mock_oauth_session, locale="en_US", language="en_US"
-        )
+        ),
+        mock_logger,
+    )
 
 
 @fixture
 def hrv_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return HeartrateVariabilityResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(
+        HeartrateVariabilityResource(mock_oauth_session, "en_US", "en_US"), mock_logger
+    )
 
 
 @fixture
 def intraday_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return IntradayResource(oauth_session=mock_oauth_session, locale="en_US", language="en_US")
+    return _with_mock_loggers(
+        IntradayResource(oauth_session=mock_oauth_session, locale="en_US", language="en_US"),
+        mock_logger,
+    )
 
 
 @fixture
 def irn_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return IrregularRhythmNotificationsResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(
+        IrregularRhythmNotificationsResource(mock_oauth_session, "en_US", "en_US"), mock_logger
+    )
 
 
 @fixture
 def nutrition_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return NutritionResource(oauth_session=mock_oauth_session, locale="en_US", language="en_US")
+    return _with_mock_loggers(
+        NutritionResource(oauth_session=mock_oauth_session, locale="en_US", language="en_US"),
+        mock_logger,
+    )
 
 
 @fixture
 def nutrition_timeseries_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return NutritionTimeSeriesResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(
+        NutritionTimeSeriesResource(mock_oauth_session, "en_US", "en_US"), mock_logger
+    )
 
 
 @fixture
 def sleep_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return SleepResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(SleepResource(mock_oauth_session, "en_US", "en_US"), mock_logger)
 
 
 @fixture
 def spo2_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return SpO2Resource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(SpO2Resource(mock_oauth_session, "en_US", "en_US"), mock_logger)
 
 
 @fixture
 def subscription_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return SubscriptionResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(
+        SubscriptionResource(mock_oauth_session, "en_US", "en_US"), mock_logger
+    )
 
 
 @fixture
 def temperature_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return TemperatureResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(
+        TemperatureResource(mock_oauth_session, "en_US", "en_US"), mock_logger
+    )
 
 
 @fixture
 def user_resource(mock_oauth_session, mock_logger):
-    with patch("fitbit_client.resources._base.getLogger", return_value=mock_logger):
-        return UserResource(mock_oauth_session, "en_US", "en_US")
+    return _with_mock_loggers(UserResource(mock_oauth_session, "en_US", "en_US"), mock_logger)
@@ -2,19 +2,15 @@
 
 """Tests for the get_azm_timeseries endpoint."""
 
+_EMPTY_AZM = {"activities-active-zone-minutes": []}
+_HEADERS = {"Accept-Locale": "en_US", "Accept-Language": "en_US"}
 
-def test_get_azm_timeseries_with_today_date(azm_resource, mock_response_factory):
+
+def test_get_azm_timeseries_with_today_date(azm_resource, respond_with, azm_url):
     """Test using 'today' as the date parameter"""
-    expected_data = {"activities-active-zone-minutes": []}
-    mock_response = mock_response_factory(200, expected_data)
-    azm_resource.oauth.request.return_value = mock_response
+    respond_with(_EMPTY_AZM)
     result = azm_resource.get_azm_timeseries_by_date(date="today")
-    assert result == expected_data
+    assert result == _EMPTY_AZM
     azm_resource.oauth.request.assert_called_once_with(
-        "GET",
-        "https://api.fitbit.com/1/user/-/activities/active-zone-minutes/date/today/1d.json",
-        data=None,
-        json=None,
-        params=None,
-        headers={"Accept-Locale": "en_US", "Accept-Language": "en_US"},
+        "GET", azm_url("-", "today/1d"), data=None, json=None, params=None, headers=_HEADERS
     )
@@ -3,8 +3,7 @@
 """Tests for the get_azm_timeseries_by_date endpoint."""
 
 # Third party imports
-
-# Third party imports
+from pytest import mark
 from pytest import raises
 
 # Local imports
@@ -12,73 +11,61 @@ from fitbit_client.exceptions import IntradayValidationException
 from fitbit_client.exceptions import InvalidDateException
 from fitbit_client.resources._constants import Period
 
+_EMPTY_AZM = {"activities-active-zone-minutes": []}
+_SAMPLE_AZM_DAY = {
+    "activities-active-zone-minutes": [
+        {
+            "dateTime": "2025-02-01",
+            "value": {
+                "activeZoneMinutes": 102,
+                "fatBurnActiveZoneMinutes": 90,
+                "cardioActiveZoneMinutes": 8,
+                "peakActiveZoneMinutes": 4,
+            },
+        }
+    ]
+}
+_HEADERS = {"Accept-Locale": "en_US", "Accept-Language": "en_US"}
+
 
-def test_get_azm_timeseries_by_date_success(azm_resource, mock_response_factory):
+def test_get_azm_timeseries_by_date_success(azm_resource, respond_with, azm_url):
     """Test successful retrieval of AZM time series by date with default period"""
-    expected_data = {
-        "activities-active-zone-minutes": [
-            {
-                "dateTime": "2025-02-01",
-                "value": {
-                    "activeZoneMinutes": 102,
-                    "fatBurnActiveZoneMinutes": 90,
-                    "cardioActiveZoneMinutes": 8,
-                    "peakActiveZoneMinutes": 4,
-                },
-            }
-        ]
-    }
-    mock_response = mock_response_factory(200, expected_data)
-    azm_resource.oauth.request.return_value = mock_response
+    respond_with(_SAMPLE_AZM_DAY)
     result = azm_resource.get_azm_timeseries_by_date(date="2025-02-01")
-    assert result == expected_data
+    assert result == _SAMPLE_AZM_DAY
     azm_resource.oauth.request.assert_called_once_with(
-        "GET",
-        "https://api.fitbit.com/1/user/-/activities/active-zone-minutes/date/2025-02-01/1d.json",
-        data=None,
-        json=None,
-        params=None,
-        headers={"Accept-Locale": "en_US", "Accept-Language": "en_US"},
+        "GET", azm_url("-", "2025-02-01/1d"), data=None, json=None, params=None, headers=_HEADERS
     )
 
 
-def test_get_azm_timeseries_by_date_explicit_period(azm_resource, mock_response_factory):
+def test_get_azm_timeseries_by_date_explicit_period(azm_resource, respond_with, azm_url):
     """Test successful retrieval of AZM time series by date with explicit ONE_DAY period"""
-    expected_data = {"activities-active-zone-minutes": []}
-    mock_response = mock_response_factory(200, expected_data)
-    azm_resource.oauth.request.return_value = mock_response
+    respond_with(_EMPTY_AZM)
     result = azm_resource.get_azm_timeseries_by_date(date="2025-02-01", period=Period.ONE_DAY)
-    assert result == expected_data
+    assert result == _EMPTY_AZM
     azm_resource.oauth.request.assert_called_once_with(
-        "GET",
-        "https://api.fitbit.com/1/user/-/activities/active-zone-minutes/date/2025-02-01/1d.json",
-        data=None,
-        json=None,
-        params=None,
-        headers={"Accept-Locale": "en_US", "Accept-Language": "en_US"},
+        "GET", azm_url("-", "2025-02-01/1d"), data=None, json=None, params=None, headers=_HEADERS
     )
 
 
-def test_get_azm_timeseries_by_date_with_user_id(azm_resource, mock_response_factory):
+def test_get_azm_timeseries_by_date_with_user_id(azm_resource, respond_with, azm_url):
     """Test getting AZM time series for a specific user"""
-    expected_data = {"activities-active-zone-minutes": []}
-    mock_response = mock_response_factory(200, expected_data)
-    azm_resource.oauth.request.return_value = mock_response
+    respond_with(_EMPTY_AZM)
     result = azm_resource.get_azm_timeseries_by_date(date="2025-02-01", user_id="123ABC")
-    assert result == expected_data
+    assert result == _EMPTY_AZM
     azm_resource.oauth.request.assert_called_once_with(
         "GET",
-        "https://api.fitbit.com/1/user/123ABC/activities/active-zone-minutes/date/2025-02-01/1d.json",
+        azm_url("123ABC", "2025-02-01/1d"),
         data=None,
         json=None,
         params=None,
-        headers={"Accept-Locale": "en_US", "Accept-Language": "en_US"},
+        headers=_HEADERS,
     )
 
 
-def test_get_azm_timeseries_by_date_invalid_period(azm_resource):
-    """Test that using any period other than ONE_DAY raises IntradayValidationException"""
-    invalid_periods = [
+@mark.parametrize(
+    "period",
+    [
         Period.SEVEN_DAYS,
         Period.THIRTY_DAYS,
         Period.ONE_WEEK,
@@ -87,14 +74,16 @@ def test_get_azm_timeseries_by_date_invalid_period(azm_resource):
         Period.SIX_MONTHS,
         Period.ONE_YEAR,
         Period.MAX,
-    ]
-    for period in invalid_periods:
-        with raises(IntradayValidationException) as exc_info:
-            azm_resource.get_azm_timeseries_by_date(date="2025-02-01", period=period)
-        assert "Only 1d period is supported for AZM time series" in str(exc_info.value)
-        assert exc_info.value.field_name == "period"
-        assert exc_info.value.allowed_values == ["1d"]
-        assert exc_info.value.resource_name == "active zone minutes"
+    ],
+)
+def test_get_azm_timeseries_by_date_invalid_period(azm_resource, period):
+    """Test that using any period other than ONE_DAY raises IntradayValidationException"""
+    with raises(IntradayValidationException) as exc_info:
+        azm_resource.get_azm_timeseries_by_date(date="2025-02-01", period=period)
+    assert "Only 1d period is supported for AZM time series" in str(exc_info.value)
+    assert exc_info.value.field_name == "period"
+    assert exc_info.value.allowed_values == ["1d"]
+    assert exc_info.value.resource_name == "active zone minutes"
 
 
 def test_get_azm_timeseries_by_date_invalid_date(azm_resource):
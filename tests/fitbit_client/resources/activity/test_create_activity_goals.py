@@ -2,9 +2,6 @@
 
 """Tests for the create_activity_goals endpoint."""
 
-# Standard library imports
-from unittest.mock import Mock
-
 # Third party imports
 from pytest import raises
 
@@ -16,7 +13,6 @@ from fitbit_client.resources._constants import ActivityGoalType
 
 def test_create_activity_goals(activity_resource):
     """Test creating activity goal"""
-    activity_resource._make_request = Mock()
     activity_resource.create_activity_goals(
         period=ActivityGoalPeriod.DAILY, type=ActivityGoalType.STEPS, value=10000
     )
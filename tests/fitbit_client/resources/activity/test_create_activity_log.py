@@ -3,101 +3,56 @@
 """Tests for the create_activity_log endpoint."""
 
 # Standard library imports
-from unittest.mock import Mock
+from unittest.mock import call
 
 # Third party imports
+from pytest import mark
 from pytest import raises
 
 # Local imports
 from fitbit_client.exceptions import InvalidDateException
 from fitbit_client.exceptions import MissingParameterException
 
-
-# Success cases - Activity ID path
-def test_create_activity_log_with_activity_id_only(activity_resource):
-    """Test creating activity log with just an activity ID"""
-    activity_resource._make_request = Mock()
-    activity_resource.create_activity_log(
-        activity_id=123, start_time="12:00", duration_millis=3600000, date="2023-01-01"
-    )
-    expected_params = {
-        "activityId": 123,
-        "startTime": "12:00",
-        "durationMillis": 3600000,
-        "date": "2023-01-01",
-    }
-    activity_resource._make_request.assert_called_once_with(
-        "activities.json", params=expected_params, user_id="-", http_method="POST", debug=False
-    )
-
-
-def test_create_activity_log_with_distance_no_unit(activity_resource):
-    """Test creating activity log with distance but no distance unit"""
-    activity_resource._make_request = Mock()
-    activity_resource.create_activity_log(
-        activity_id=123,
-        start_time="12:00",
-        duration_millis=3600000,
-        date="2023-01-01",
-        distance=5.0,
-    )
-    expected_params = {
-        "activityId": 123,
-        "startTime": "12:00",
-        "durationMillis": 3600000,
-        "date": "2023-01-01",
-        "distance": 5.0,
-    }
-    activity_resource._make_request.assert_called_once_with(
-        "activities.json", params=expected_params, user_id="-", http_method="POST", debug=False
-    )
-
-
-def test_create_activity_log_with_distance_and_unit(activity_resource):
-    """Test creating activity log with distance and distance unit"""
-    activity_resource._make_request = Mock()
-    activity_resource.create_activity_log(
-        activity_id=123,
-        start_time="12:00",
-        duration_millis=3600000,
-        date="2023-01-01",
-        distance=5.0,
-        distance_unit="km",
-    )
-    expected_params = {
-        "activityId": 123,
-        "startTime": "12:00",
-        "durationMillis": 3600000,
-        "date": "2023-01-01",
-        "distance": 5.0,
-        "distanceUnit": "km",
-    }
-    activity_resource._make_request.assert_called_once_with(
-        "activities.json", params=expected_params, user_id="-", http_method="POST", debug=False
-    )
-
-
-# Success cases - Custom activity path
-def test_create_activity_log_with_custom_activity(activity_resource):
-    """Test creating activity log with custom activity name and manual calories"""
-    activity_resource._make_request = Mock()
-    activity_resource.create_activity_log(
-        activity_name="Custom Yoga",
-        manual_calories=250,
-        start_time="12:00",
-        duration_millis=3600000,
-        date="2023-01-01",
-    )
-    expected_params = {
-        "activityName": "Custom Yoga",
-        "manualCalories": 250,
-        "startTime": "12:00",
-        "durationMillis": 3600000,
-        "date": "2023-01-01",
-    }
-    activity_resource._make_request.assert_called_once_with(
-        "activities.json", params=expected_params, user_id="-", http_method="POST", debug=False
-    )
+_TIMING = {"start_time": "12:00", "duration_millis": 3600000, "date": "2023-01-01"}
+_BASE_LOG_PARAMS = {
+    "activityId": 123,
+    "startTime": "12:00",
+    "durationMillis": 3600000,
+    "date": "2023-01-01",
+}
+_CUSTOM_LOG_PARAMS = {
+    "activityName": "Custom Yoga",
+    "manualCalories": 250,
+    "startTime": "12:00",
+    "durationMillis": 3600000,
+    "date": "2023-01-01",
+}
+
+
+def _expected_call(params):
+    """Build the _make_request call create_activity_log should make for the given params"""
+    return call("activities.json", params=params, user_id="-", http_method="POST", debug=False)
+
+
+# Success cases
+@mark.parametrize(
+    "method_kwargs,expected_params",
+    [
+        ({"activity_id": 123}, _BASE_LOG_PARAMS),
+        ({"activity_id": 123, "distance": 5.0}, {**_BASE_LOG_PARAMS, "distance": 5.0}),
+        (
+            {"activity_id": 123, "distance": 5.0, "distance_unit": "km"},
+            {**_BASE_LOG_PARAMS, "distance": 5.0, "distanceUnit": "km"},
+        ),
+        ({"activity_name": "Custom Yoga", "manual_calories": 250}, _CUSTOM_LOG_PARAMS),
+    ],
+    ids=["activity_id_only", "distance_no_unit", "distance_and_unit", "custom_activity"],
+)
+def test_create_activity_log(activity_resource, method_kwargs, expected_params):
+    """Test creating activity logs from an activity ID or a custom activity"""
+    activity_resource.create_activity_log(**method_kwargs, **_TIMING)
+    assert activity_resource._make_request.call_count == 1
+    assert activity_resource._make_request.call_args == _expected_call(expected_params)
 
 
 # Error cases
@@ -2,11 +2,6 @@
 
 """Tests for the get_daily_activity_summary endpoint."""
 
-# Standard library imports
-
-# Standard library imports
-from unittest.mock import Mock
-
 # Third party imports
 from pytest import raises
 
@@ -14,15 +9,6 @@ from pytest import raises
 from fitbit_client.exceptions import InvalidDateException
 
 
-def test_get_daily_activity_summary_success(activity_resource):
-    """Test getting daily activity summary"""
-    activity_resource._make_request = Mock()
-    activity_resource.get_daily_activity_summary("2023-01-01")
-    activity_resource._make_request.assert_called_once_with(
-        "activities/date/2023-01-01.json", user_id="-", debug=False
-    )
-
-
 def test_get_daily_activity_summary_invalid_date(activity_resource):
     """Test that invalid date format raises InvalidDateException"""
     with raises(InvalidDateException) as exc_info:
@@ -0,0 +1,58 @@
+# tests/fitbit_client/resources/activity/test_simple_endpoints.py
+
+"""Tests for activity endpoints that only build a request from their arguments."""
+
+# Standard library imports
+from unittest.mock import call
+
+# Third party imports
+from pytest import mark
+
+# Local imports
+from fitbit_client.resources._constants import ActivityGoalPeriod
+
+_ENDPOINTS = [
+    (
+        "get_activity_goals",
+        (ActivityGoalPeriod.DAILY,),
+        call("activities/goals/daily.json", user_id="-", debug=False),
+    ),
+    ("get_favorite_activities", (), call("activities/favorite.json", user_id="-", debug=False)),
+    ("get_frequent_activities", (), call("activities/frequent.json", user_id="-", debug=False)),
+    ("get_recent_activity_types", (), call("activities/recent.json", user_id="-", debug=False)),
+    ("get_lifetime_stats", (), call("activities.json", user_id="-", debug=False)),
+    (
+        "create_favorite_activity",
+        ("123",),
+        call("activities/favorite/123.json", user_id="-", http_method="POST", debug=False),
+    ),
+    (
+        "delete_activity_log",
+        ("123",),
+        call("activities/123.json", user_id="-", http_method="DELETE", debug=False),
+    ),
+    (
+        "delete_favorite_activity",
+        ("123",),
+        call("activities/favorite/123.json", user_id="-", http_method="DELETE", debug=False),
+    ),
+    (
+        "get_daily_activity_summary",
+        ("2023-01-01",),
+        call("activities/date/2023-01-01.json", user_id="-", debug=False),
+    ),
+    (
+        "get_activity_type",
+        ("123",),
+        call("activities/123.json", requires_user_id=False, debug=False),
+    ),
+    ("get_all_activity_types", (), call("activities.json", requires_user_id=False, debug=False)),
+]
+
+
+@mark.parametrize("method, args, expected_call", _ENDPOINTS, ids=[row[0] for row in _ENDPOINTS])
+def test_simple_endpoint(activity_resource, method, args, expected_call):
+    """Test that each endpoint passes the expected path and arguments to _make_request"""
+    getattr(activity_resource, method)(*args)
+    assert activity_resource._make_request.call_count == 1
+    assert activity_resource._make_request.call_args == expected_call
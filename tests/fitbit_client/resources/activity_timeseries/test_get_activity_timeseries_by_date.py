@@ -5,6 +5,7 @@
 # Third party imports
 
 # Third party imports
+from pytest import mark
 from pytest import raises
 
 # Local imports
@@ -12,6 +13,8 @@ from fitbit_client.exceptions import InvalidDateException
 from fitbit_client.resources._constants import ActivityTimeSeriesPath
 from fitbit_client.resources._constants import Period
 
+_HEADERS = {"Accept-Locale": "en_US", "Accept-Language": "en_US"}
+
 
 def test_get_activity_timeseries_by_date_success(
     activity_timeseries_resource, mock_response_factory
@@ -31,7 +34,7 @@ def test_get_activity_timeseries_by_date_success(
         data=None,
         json=None,
         params=None,
-        headers={"Accept-Locale": "en_US", "Accept-Language": "en_US"},
+        headers=_HEADERS,
     )
 
 
@@ -53,7 +56,7 @@ def test_get_activity_timeseries_by_date_with_user_id(
         data=None,
         json=None,
         params=None,
-        headers={"Accept-Locale": "en_US", "Accept-Language": "en_US"},
+        headers=_HEADERS,
     )
 
 
@@ -72,7 +75,17 @@ def test_get_activity_timeseries_by_date_invalid_date(activity_timeseries_resour
 # Local imports
 
 
-def test_calories_variants(activity_timeseries_resource, mock_response_factory):
+@mark.parametrize(
+    "calorie_type",
+    [
+        ActivityTimeSeriesPath.ACTIVITY_CALORIES,
+        ActivityTimeSeriesPath.CALORIES,
+        ActivityTimeSeriesPath.CALORIES_BMR,
+        ActivityTimeSeriesPath.TRACKER_CALORIES,
+        ActivityTimeSeriesPath.TRACKER_ACTIVITY_CALORIES,
+    ],
+)
+def test_calories_variants(activity_timeseries_resource, mock_response_factory, calorie_type):
     """Test different calorie measurement types return expected data"""
     mock_response = mock_response_factory(
         200,
@@ -83,18 +96,10 @@ def test_calories_variants(activity_timeseries_resource, mock_response_factory):
         },
     )
     activity_timeseries_resource.oauth.request.return_value = mock_response
-    calorie_types = [
-        ActivityTimeSeriesPath.ACTIVITY_CALORIES,
-        ActivityTimeSeriesPath.CALORIES,
-        ActivityTimeSeriesPath.CALORIES_BMR,
-        ActivityTimeSeriesPath.TRACKER_CALORIES,
-        ActivityTimeSeriesPath.TRACKER_ACTIVITY_CALORIES,
-    ]
-    for calorie_type in calorie_types:
-        result = activity_timeseries_resource.get_activity_timeseries_by_date(
-            resource_path=calorie_type, date="2024-02-01", period=Period.ONE_DAY
-        )
-        assert isinstance(result, dict)
-        if result:
-            for entry in next(iter(result.values())):
-                assert entry["value"].isdigit()
+    result = activity_timeseries_resource.get_activity_timeseries_by_date(
+        resource_path=calorie_type, date="2024-02-01", period=Period.ONE_DAY
+    )
+    assert isinstance(result, dict)
+    if result:
+        for entry in next(iter(result.values())):
+            assert entry["value"].isdigit()
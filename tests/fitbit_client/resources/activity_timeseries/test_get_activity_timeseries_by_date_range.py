@@ -5,6 +5,7 @@
 # Third party imports
 
 # Third party imports
+from pytest import mark
 from pytest import raises
 
 # Local imports
@@ -13,6 +14,8 @@ from fitbit_client.exceptions import InvalidDateRangeException
 from fitbit_client.exceptions import ValidationException
 from fitbit_client.resources._constants import ActivityTimeSeriesPath
 
+_HEADERS = {"Accept-Locale": "en_US", "Accept-Language": "en_US"}
+
 
 def test_get_activity_timeseries_by_date_range_success(
     activity_timeseries_resource, mock_response_factory
@@ -43,7 +46,7 @@ def test_get_activity_timeseries_by_date_range_success(
         data=None,
         json=None,
         params=None,
-        headers={"Accept-Locale": "en_US", "Accept-Language": "en_US"},
+        headers=_HEADERS,
     )
 
 
@@ -65,7 +68,7 @@ def test_get_activity_timeseries_by_date_range_with_user_id(
         data=None,
         json=None,
         params=None,
-        headers={"Accept-Locale": "en_US", "Accept-Language": "en_US"},
+        headers=_HEADERS,
     )
 
 
@@ -96,21 +99,29 @@ def test_get_activity_timeseries_by_date_range_invalid_date_order(activity_times
     assert f"Start date 2024-02-02 is after end date 2024-02-01" in str(exc_info.value)
 
 
+@mark.parametrize(
+    "error_response",
+    [
+        (
+            400,
+            {
+                "errors": [
+                    {
+                        "errorType": "validation",
+                        "message": (
+                            "The range cannot exceed 31 days for resource type activityCalories"
+                        ),
+                    }
+                ]
+            },
+        )
+    ],
+    indirect=True,
+)
 def test_get_activity_timeseries_activity_calories_range_limit(
-    activity_timeseries_resource, mock_response_factory
+    activity_timeseries_resource, error_response
 ):
     """Test that activity calories respects the 30 day limit"""
-    error_response = mock_response_factory(
-        400,
-        {
-            "errors": [
-                {
-                    "errorType": "validation",
-                    "message": "The range cannot exceed 31 days for resource type activityCalories",
-                }
-            ]
-        },
-    )
     activity_timeseries_resource.oauth.request.return_value = error_response
     with raises(ValidationException) as exc_info:
         activity_timeseries_resource.get_activity_timeseries_by_date_range(
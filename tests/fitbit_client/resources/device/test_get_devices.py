@@ -2,12 +2,18 @@
 
 """Tests for the get_devices endpoint."""
 
-# Third party imports
-
 # Third party imports
 from pytest import mark
 from pytest import raises
 
+# Local imports
+from fitbit_client.exceptions import InsufficientPermissionsException
+from fitbit_client.exceptions import InvalidRequestException
+from fitbit_client.exceptions import InvalidTokenException
+from fitbit_client.exceptions import NotFoundException
+from fitbit_client.exceptions import RateLimitExceededException
+from fitbit_client.exceptions import SystemException
+
 
 def test_get_devices_success(device_resource, mock_oauth_session, mock_response_factory):
     """Test successful retrieval of devices list."""
@@ -57,26 +63,30 @@ def test_get_devices_debug_mode(device_resource, mock_oauth_session, capsys):
     assert result is None
 
 
-@mark.parametrize("status_code", [400, 401, 403, 404, 429, 500])
+@mark.parametrize(
+    "status_code,error_type,exc_cls",
+    [
+        (400, "invalid_request", InvalidRequestException),
+        (401, "invalid_token", InvalidTokenException),
+        (403, "insufficient_permissions", InsufficientPermissionsException),
+        (404, "not_found", NotFoundException),
+        (429, "rate_limit_exceeded", RateLimitExceededException),
+        (500, "system", SystemException),
+    ],
+)
 def test_get_devices_error_responses(
-    device_resource, mock_oauth_session, mock_response_factory, status_code
+    device_resource, mock_oauth_session, mock_response_factory, status_code, error_type, exc_cls
 ):
     """Test handling of various error responses."""
     mock_response = mock_response_factory(
-        status_code, {"errors": [{"errorType": "system", "message": f"Error {status_code}"}]}
+        status_code, {"errors": [{"errorType": error_type, "message": f"Error {status_code}"}]}
     )
     mock_oauth_session.request.return_value = mock_response
 
     # Disable retry for rate limit tests to prevent hanging
-    if status_code == 429:
-        original_max_retries = device_resource.max_retries
-        device_resource.max_retries = 0
+    device_resource.max_retries = 0
 
-    try:
-        with raises(Exception) as exc_info:
-            device_resource.get_devices()
-        assert exc_info.value.status_code == status_code
-    finally:
-        # Restore original retry setting
-        if status_code == 429:
-            device_resource.max_retries = original_max_retries
+    with raises(exc_cls) as exc_info:
+        device_resource.get_devices()
+    assert exc_info.value.status_code == status_code
+    assert exc_info.value.error_type == error_type
@@ -56,28 +56,17 @@ def sample_pagination_next_response() -> JSONDict:
     }
 
 
-def test_import_with_type_checking():
+def test_import_with_type_checking(monkeypatch):
     """Test BaseResource import with TYPE_CHECKING enabled"""
-    # Store original value
-    original_type_checking = typing.TYPE_CHECKING
+    # monkeypatch restores both of these afterwards, so later tests (or other
+    # xdist workers' ordering) still see the original PaginatedIterator class
+    monkeypatch.setattr(typing, "TYPE_CHECKING", True)
 
-    try:
-        # Override TYPE_CHECKING to True
-        typing.TYPE_CHECKING = True
-
-        # Force reload of the module
-        if "fitbit_client.resources._pagination" in sys.modules:
-            del sys.modules["fitbit_client.resources._pagination"]
-
-        # Now import the module with TYPE_CHECKING as True
-        # Local imports
-
-        # This should have imported BaseResource due to TYPE_CHECKING being True
-        assert "fitbit_client.resources._base" in sys.modules
+    # Force reload of the module
+    monkeypatch.delitem(sys.modules, "fitbit_client.resources._pagination", raising=False)
 
-    finally:
-        # Restore TYPE_CHECKING to its original value
-        typing.TYPE_CHECKING = original_type_checking
+    # This should have imported BaseResource due to TYPE_CHECKING being True
+    assert "fitbit_client.resources._base" in sys.modules
 
 
 def test_create_paginated_iterator(mock_resource, sample_pagination_response):